@@ -0,0 +1,169 @@
+import asyncio
+import types
+from typing import Any, Iterator, List, Optional, Tuple, cast
+
+import _pytest.monkeypatch
+import pytest
+
+import tmt.steps.provision.mrack
+from tmt.steps.provision.mrack import (BeakerAPI, GuestBeaker,
+                                       GuestInspectType, _parse_amount)
+from tmt.utils import ProvisionError, updatable_message
+
+
+@pytest.mark.parametrize(
+    ('amount', 'expected'),
+    [
+        ('8 GB', ('=', 8000)),
+        ('= 8 GB', ('=', 8000)),
+        ('>= 8 GB', ('>=', 8000)),
+        ('<=8GB', ('<=', 8000)),
+        ('> 512 MiB', ('>', 512)),
+        ('< 2 GiB', ('<', 2048)),
+        ('~= 4 MB', ('~=', 4)),
+        ('1 TB', ('=', 1000000)),
+        ('1 TiB', ('=', 1048576)),
+        ('  >= 40 GiB  ', ('>=', 40960)),
+        ]
+    )
+def test_parse_amount(amount: str, expected: Tuple[str, int]) -> None:
+    assert _parse_amount(amount) == expected
+
+
+@pytest.mark.parametrize(
+    'amount',
+    [
+        '',
+        '8',
+        'GB',
+        '>= GB',
+        '8 PB',
+        '8 gb',
+        '8.5 GB',
+        '-1 GB',
+        '=> 8 GB',
+        '>= 8 GB extra',
+        ]
+    )
+def test_parse_amount_invalid(amount: str) -> None:
+    with pytest.raises(ProvisionError, match='Invalid amount'):
+        _parse_amount(amount)
+
+
+class FakeClock:
+    """ Clock advanced only by the sleeps of the reservation wait """
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: List[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+class StubAPI:
+    """ Beaker API returning the given job states, one per inspection """
+
+    def __init__(self, states: List[str]) -> None:
+        self.states: Iterator[str] = iter(states)
+        self.deleted = False
+
+    async def inspect(self) -> Any:
+        return {"status": next(self.states)}
+
+    async def delete(self) -> None:
+        self.deleted = True
+
+
+class StubMessage:
+    """ Progress message remembering all displayed states """
+
+    def __init__(self) -> None:
+        self.values: List[str] = []
+
+    def update(self, value: str, color: Optional[str] = None) -> None:
+        self.values.append(value)
+
+
+@pytest.fixture(name='clock')
+def fixture_clock(monkeypatch: _pytest.monkeypatch.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(tmt.steps.provision.mrack, 'DEFAULT_PROVISION_TICK_MIN', 5)
+    monkeypatch.setattr(
+        tmt.steps.provision.mrack, 'time', types.SimpleNamespace(monotonic=clock.monotonic))
+    monkeypatch.setattr(
+        tmt.steps.provision.mrack, 'asyncio', types.SimpleNamespace(sleep=clock.sleep))
+    return clock
+
+
+def _wait_for_reservation(
+        states: List[str],
+        api: StubAPI,
+        message: StubMessage,
+        provision_tick: int = 20,
+        provision_timeout: int = 3600) -> Any:
+    """ Wait for the first of given states, polling the remaining ones """
+    guest = object.__new__(GuestBeaker)
+    guest.provision_tick = provision_tick
+    guest.provision_timeout = provision_timeout
+
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(guest._wait_for_reservation(
+            cast(BeakerAPI, api),
+            cast(GuestInspectType, {"status": states[0]}),
+            cast(updatable_message, message)))
+    finally:
+        loop.close()
+
+
+def test_wait_for_reservation_interval(clock: FakeClock) -> None:
+    states = ['New', 'Queued', 'Queued', 'Queued', 'Queued', 'Scheduled', 'Scheduled',
+              'Reserved']
+    api, message = StubAPI(states[1:]), StubMessage()
+
+    assert _wait_for_reservation(states, api, message) == {"status": "Reserved"}
+    # Reset to the minimum on each change, double up to the tick otherwise
+    assert clock.sleeps == [5, 5, 10, 20, 20, 5, 10]
+    assert message.values == states
+    assert not api.deleted
+
+
+@pytest.mark.parametrize('state', ['Error', 'Aborted', 'Cancelled'])
+def test_wait_for_reservation_failed(clock: FakeClock, state: str) -> None:
+    api, message = StubAPI([]), StubMessage()
+
+    with pytest.raises(ProvisionError, match=f"failed with state '{state}'"):
+        _wait_for_reservation([state], api, message)
+
+    assert clock.sleeps == []
+    assert message.values == [state]
+    assert not api.deleted
+
+
+def test_wait_for_reservation_timeout(clock: FakeClock) -> None:
+    api, message = StubAPI(['Queued'] * 10), StubMessage()
+
+    with pytest.raises(ProvisionError, match='--provision-timeout=30'):
+        _wait_for_reservation(['Queued'], api, message, provision_timeout=30)
+
+    # The last sleep is shortened to hit the deadline exactly
+    assert clock.sleeps == [5, 10, 15]
+    assert api.deleted
+
+
+def test_wait_for_reservation_error(clock: FakeClock) -> None:
+    """ Job ending in Error fails right away, not after the timeout """
+    states = ['New', 'Queued', 'Processed', 'Error']
+    api, message = StubAPI(states[1:]), StubMessage()
+
+    with pytest.raises(ProvisionError, match="failed with state 'Error'"):
+        _wait_for_reservation(states, api, message)
+
+    assert clock.sleeps == [5, 5, 5]
+    assert message.values == states
+    assert not api.deleted
@@ -869,6 +869,22 @@ def test_wait_success_but_too_late(root_logger):
         wait(Common(logger=root_logger), check, datetime.timedelta(seconds=1))
 
 
+def test_updatable_message_unchanged(capsys):
+    """ :py:class:`updatable_message` shall not redraw an unchanged message """
+
+    with tmt.utils.updatable_message('status') as message:
+        # Output is disabled when stdout is not a terminal
+        message.enabled = True
+
+        message.update('New', color='blue')
+        message.update('New', color='blue')
+        message.update('Queued', color='cyan')
+        message.update('Queued', color='cyan')
+        message.update('Queued', color='green')
+
+    assert capsys.readouterr().out.count('\r') == 3
+
+
 def test_import_member():
     klass = tmt.plugins.import_member('tmt.steps.discover', 'Discover')
 
@@ -550,17 +550,15 @@ class ProvisionArtemis(tmt.steps.provision.ProvisionPlugin):
         if api_version not in SUPPORTED_API_VERSIONS:
             raise ProvisionError(f"API version '{api_version}' not supported.")
 
-        try:
-            user_data = {
-                key.strip(): value.strip()
-                for key, value in (
-                    pair.split('=', 1)
-                    for pair in self.get('user-data')
-                    )
-                }
+        user_data: Dict[str, str] = {}
+
+        for pair in self.get('user-data'):
+            key, separator, value = pair.partition('=')
+
+            if not separator:
+                raise ProvisionError(f"Cannot parse user-data '{pair}'.")
 
-        except ValueError:
-            raise ProvisionError('Cannot parse user-data.')
+            user_data[key.strip()] = value.strip()
 
         data = ArtemisGuestData(
             api_url=self.get('api-url'),
@@ -1,9 +1,15 @@
+import asyncio
 import dataclasses
-import datetime
 import logging
 import os
+import re
 import sys
-from typing import Any, Dict, List, Optional, Tuple, cast
+import threading
+import time
+import types
+from functools import lru_cache
+from typing import (Any, Callable, Coroutine, Dict, List, Optional, Tuple,
+                    TypeVar, cast)
 
 import click
 
@@ -19,9 +25,6 @@ if sys.version_info >= (3, 8):
 else:
     from typing_extensions import TypedDict
 
-import asyncio
-from functools import wraps
-
 mrack = Any
 providers = Any
 ProvisioningError = Any
@@ -31,19 +34,27 @@ BeakerProvider = Any
 BeakerTransformer = Any
 TmtBeakerTransformer = Any
 
+# Handler collecting mrack logs in the run workdir
+mrack_log_handler: Optional[logging.Handler] = None
+
+T = TypeVar('T')
+
 DEFAULT_USER = 'root'
 DEFAULT_ARCH = 'x86_64'
 DEFAULT_PROVISION_TIMEOUT = 3600  # 1 hour timeout at least
-DEFAULT_PROVISION_TICK = 60  # poll job each minute
+DEFAULT_PROVISION_TICK = 60  # poll job each minute at most
+DEFAULT_PROVISION_TICK_MIN = 5  # poll job this often after a state change
 
 
-# Type annotation for "data" package describing a guest instance. Passed
-# between load() and save() calls
+# Type annotation for recipe info describing a guest instance, as returned
+# by mrack when inspecting the Beaker job
 GuestInspectType = TypedDict(
     'GuestInspectType', {
+        "id": str,
+        "rid": str,
         "status": str,
-        "system": str,
-        'address': Optional[str]
+        "result": str,
+        "system": Optional[str],
         }
     )
 
@@ -65,13 +76,51 @@ operators = [
     "=",
     ]
 
+# Amount with an optional operator and a size unit, e.g. ">= 8 GB"
+AMOUNT_PATTERN = re.compile(
+    r"^\s*(?P<operator>{})?\s*(?P<amount>\d+)\s*(?P<unit>{})\s*$".format(
+        "|".join(re.escape(operator) for operator in operators),
+        "|".join(size_translation),
+        )
+    )
+
+
+def _parse_amount(in_string: str) -> Tuple[str, int]:
+    """ Return operator and amount in megabytes from given string """
+    match = AMOUNT_PATTERN.match(in_string)
+    if match is None:
+        raise ProvisionError(f"Invalid amount '{in_string}'.")
+
+    operator = match.group("operator") or "="
+    amount = int(match.group("amount")) * size_translation[match.group("unit")]
 
-def import_and_load_mrack_deps(workdir: Any, name: str) -> None:
+    return operator, amount
+
+
+def import_and_load_mrack_deps(workdir: Any) -> None:
     """
     Import mrack module only when needed
 
-    Until we have a separate package for each plugin.
+    Until we have a separate package for each plugin. Modules are
+    imported only once. mrack logs through a single global logger,
+    therefore its output for all Beaker guests of the run is collected
+    in one ``mrack.log`` file in the given run workdir.
     """
+    global mrack_log_handler
+
+    _import_mrack()
+
+    if mrack_log_handler is not None:
+        return
+
+    mrack_log_handler = logging.FileHandler(f"{workdir}/mrack.log")
+    mrack_log_handler.setFormatter(mrack.file_handler.formatter)
+    mrack.logger.addHandler(mrack_log_handler)
+
+
+@lru_cache(maxsize=None)
+def _import_mrack() -> None:
+    """ Import mrack modules, register the provider and define transformer """
     global mrack
     global providers
     global ProvisioningError
@@ -89,12 +138,12 @@ def import_and_load_mrack_deps(workdir: Any, name: str) -> None:
         from mrack.providers.beaker import BeakerProvider
         from mrack.transformers.beaker import BeakerTransformer
 
-        # HAX remove mrack stdout and move the logfile to /tmp
-        mrack.logger.removeHandler(mrack.console_handler)
-        mrack.logger.removeHandler(mrack.file_handler)
-        if os.stat("mrack.log"):
+        # HAX remove mrack stdout and the logfile in the current directory
+        for handler in (mrack.console_handler, mrack.file_handler):
+            mrack.logger.removeHandler(handler)
+            handler.close()
+        if os.path.exists("mrack.log"):
             os.remove("mrack.log")
-        logging.FileHandler(str(f"{workdir}/{name}-mrack.log"))
 
         providers.register(BEAKER, BeakerProvider)
 
@@ -105,93 +154,74 @@ def import_and_load_mrack_deps(workdir: Any, name: str) -> None:
     # error: Class cannot subclass "BeakerTransformer" (has type "Any")
     # as mypy does not have type information for the BeakerTransformer class
     class TmtBeakerTransformer(BeakerTransformer):  # type: ignore[misc]
-        def _parse_amount(self, in_string: str) -> Tuple[str, int]:
-            """ Return amount from given string """
-            result = []
-            amount = ""
-
-            for op in operators:
-                parts = in_string.split(op, maxsplit=1)
-                if len(parts) != 2:
-                    continue
-
-                if parts[0]:
-                    continue
-
-                if any([op in parts[1] for op in op]):
-                    continue
-
-                result.append(op)
-                amount = parts[1]
-                break
-
-            assert len(result) == 1
-            assert len(amount) >= 1
-
-            for size, multiplier in size_translation.items():
-                if size not in amount:
-                    continue
-
-                result.append(str(multiplier * int(amount.split(size, maxsplit=1)[0])))
-                break
+        def _translate_memory(
+                self,
+                memory: str,
+                system: Dict[str, Any],
+                disks: List[Dict[str, Any]],
+                cpu: Dict[str, Any]) -> None:
+            """ Translate memory requirement """
+            operator, amount = _parse_amount(memory)
+            system["memory"] = {
+                "_value": amount,
+                "_op": operator,
+                }
+
+        def _translate_disk(
+                self,
+                disk: List[Dict[str, Any]],
+                system: Dict[str, Any],
+                disks: List[Dict[str, Any]],
+                cpu: Dict[str, Any]) -> None:
+            """ Translate disk requirements """
+            for dsk in disk:
+                operator, size = _parse_amount(dsk["size"])
+                disks.append({
+                    "disk": {
+                        "size": {
+                            "_value": size,
+                            "_op": operator,
+                            }
+                        }
+                    })
+
+        def _translate_cpu(
+                self,
+                processor: Dict[str, Any],
+                system: Dict[str, Any],
+                disks: List[Dict[str, Any]],
+                cpu: Dict[str, Any]) -> None:
+            """ Translate cpu requirements """
+            if processor.get("processors"):
+                cpu["cpu_count"] = {
+                    "_value": processor["processors"],
+                    "_op": "=",
+                    }
+            if processor.get("model"):
+                cpu["model"] = {
+                    "_value": processor["model"],
+                    "_op": "=",
+                    }
 
-            # returns operator, amount
-            return result[0], int(result[1])
+        # Translation of each supported hw requirement key
+        _hw_translators: Dict[str, Callable[..., None]] = {
+            "memory": _translate_memory,
+            "disk": _translate_disk,
+            "cpu": _translate_cpu,
+            }
 
         def _translate_tmt_hw(self, hw: Dict[str, Any]) -> Dict[str, Any]:
             """ Return hw requirements from given hw dictionary """
-            key = "_key"
-            value = "_value"
-            op = "_op"
-
-            system = {}
-            disks = []
-            cpu = {}
+            system: Dict[str, Any] = {}
+            disks: List[Dict[str, Any]] = []
+            cpu: Dict[str, Any] = {}
 
             for key, val in hw.items():
-                if key == "memory":
-                    operator, amount = self._parse_amount(val)
-                    system.update({
-                        key: {
-                            value: amount,
-                            op: operator
-                            }
-                        })
-                if key == "disk":
-                    for dsk in val:
-                        operator, disk = self._parse_amount(dsk["size"])
-                        disks.append({
-                            "disk": {
-                                "size": {
-                                    value: disk,
-                                    op: operator,
-                                    }
-                                }
-                            })
-                if key == "cpu":
-                    if val.get("processors"):
-                        cpu.update({
-                            "cpu_count": {
-                                value: val["processors"],
-                                op: "=",
-                                }
-                            })
-                    if val.get("model"):
-                        cpu.update({
-                            "model": {
-                                value: val["model"],
-                                op: "=",
-                                }
-                            })
-
-            and_req = []
-            for rec in [system, disks, cpu]:
-                if not rec:
-                    continue
-                if isinstance(rec, dict):
-                    and_req.append(rec)
-                if isinstance(rec, list):
-                    and_req += rec
+                translator = self._hw_translators.get(key)
+                if translator is not None:
+                    translator(self, val, system, disks, cpu)
+
+            and_req = ([system] if system else []) + disks + ([cpu] if cpu else [])
 
             host_req = {}
             if and_req:
@@ -205,20 +235,49 @@ def import_and_load_mrack_deps(workdir: Any, name: str) -> None:
 
         def create_host_requirement(self, host: Dict[str, Any]) -> Dict[str, Any]:
             """ Create single input for Beaker provisioner """
-            mrack_req: Dict[str, Any] = self._translate_tmt_hw(host.get("hardware", {}))
-            host.update({"beaker": mrack_req})
+            host["beaker"] = self._translate_tmt_hw(host.get("hardware", {}))
             req: Dict[str, Any] = super().create_host_requirement(host)
-            req.update({"whiteboard": host.get("tmt_name", req.get("whiteboard"))})
+            # Name the job after the guest, mrack sets its default whiteboard
+            if "tmt_name" in host:
+                req["whiteboard"] = host["tmt_name"]
             return req
 
 
-def async_run(func: Any) -> Any:
-    """ Decorate click actions to run as async """
-    @wraps(func)
-    def update_wrapper(*args: Any, **kwargs: Any) -> Any:
-        return asyncio.run(func(*args, **kwargs))
+# Event loop shared by all Beaker API calls, running in a background thread
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_LOOP_LOCK = threading.Lock()
+
 
-    return update_wrapper
+def _event_loop() -> asyncio.AbstractEventLoop:
+    """ Return the shared event loop, start it when needed """
+    global _LOOP
+
+    with _LOOP_LOCK:
+        if _LOOP is None:
+            _LOOP = asyncio.new_event_loop()
+            threading.Thread(
+                target=_LOOP.run_forever,
+                name='tmt-beaker-loop',
+                daemon=True).start()
+
+    return _LOOP
+
+
+def run_async(coroutine: Coroutine[Any, Any, T]) -> T:
+    """
+    Run the coroutine in the shared event loop and wait for its result
+
+    Unlike ``asyncio.run()``, the loop is not created and closed for each
+    call, therefore state bound to it survives between API calls. When
+    the wait is interrupted, e.g. by Ctrl-C, the coroutine is cancelled
+    so that it does not keep running in the loop.
+    """
+    future = asyncio.run_coroutine_threadsafe(coroutine, _event_loop())
+    try:
+        return future.result()
+    except BaseException:
+        future.cancel()
+        raise
 
 
 @dataclasses.dataclass
@@ -233,6 +292,7 @@ class BeakerGuestData(tmt.steps.provision.GuestSshData):
 
     # Provided in Beaker job
     job_id: Optional[str] = None
+    bkr_job_id: Optional[str] = None
 
     # Timeouts and deadlines
     provision_timeout: int = DEFAULT_PROVISION_TIMEOUT
@@ -246,7 +306,7 @@ class ProvisionBeakerData(BeakerGuestData, tmt.steps.provision.ProvisionStepData
 
 GUEST_STATE_COLOR_DEFAULT = 'green'
 
-GUEST_STATE_COLORS = {
+GUEST_STATE_COLORS = types.MappingProxyType({
     "New": "blue",
     "Scheduled": "blue",
     "Queued": "cyan",
@@ -258,70 +318,125 @@ GUEST_STATE_COLORS = {
     "Aborted": "yellow",
     "Reserved": "green",
     "Completed": "green",
-    }
+    })
 
 
-class BeakerAPI:
-    # req is a requirement passed to Beaker mrack provisioner
-    mrack_requirement: Dict[str, Any] = {}
-    dsp_name: str = "Beaker"
+def _find_mrack_config() -> str:
+    """ Find the mrack configuration file, the most specific one wins """
+    mrack_config = ""
 
-    # wrapping around the __init__ with async wrapper does mangle the method
-    # and mypy complains as it no longer returns None but the coroutine
-    @async_run
-    async def __init__(self, guest: 'GuestBeaker') -> None:  # type: ignore[misc]
-        """ Initialize the API class with defaults and load the config """
-        self._guest = guest
+    if os.path.exists(os.path.join(os.path.dirname(__file__), "mrack/mrack.conf")):
+        mrack_config = os.path.join(
+            os.path.dirname(__file__),
+            "mrack/mrack.conf",
+            )
 
-        # use global context class
-        global_context = mrack.context.global_context
-        mrack_config = ""
+    if os.path.exists("/etc/tmt/mrack.conf"):
+        mrack_config = "/etc/tmt/mrack.conf"
 
-        if os.path.exists(os.path.join(os.path.dirname(__file__), "mrack/mrack.conf")):
-            mrack_config = os.path.join(
-                os.path.dirname(__file__),
-                "mrack/mrack.conf",
-                )
+    if os.path.exists(os.path.join(os.path.expanduser("~"), ".mrack/mrack.conf")):
+        mrack_config = os.path.join(os.path.expanduser("~"), ".mrack/mrack.conf")
 
-        if os.path.exists("/etc/tmt/mrack.conf"):
-            mrack_config = "/etc/tmt/mrack.conf"
+    if os.path.exists(os.path.join(os.getcwd(), "mrack.conf")):
+        mrack_config = os.path.join(os.getcwd(), "mrack.conf")
 
-        if os.path.exists(os.path.join(os.path.expanduser("~"), ".mrack/mrack.conf")):
-            mrack_config = os.path.join(os.path.expanduser("~"), ".mrack/mrack.conf")
+    if not mrack_config:
+        raise ProvisionError("Configuration file 'mrack.conf' not found.")
 
-        if os.path.exists(os.path.join(os.getcwd(), "mrack.conf")):
-            mrack_config = os.path.join(os.getcwd(), "mrack.conf")
+    return mrack_config
 
-        if not mrack_config:
-            raise ProvisionError("Configuration file 'mrack.conf' not found.")
 
-        try:
-            global_context.init(mrack_config)
-        except mrack.errors.ConfigError as mrack_conf_err:
-            raise ProvisionError(mrack_conf_err)
+@lru_cache(maxsize=1)
+def _init_global_context(mrack_config: str) -> Any:
+    """
+    Initialize mrack global context from the given configuration
 
-        self._mrack_transformer = TmtBeakerTransformer()
-        try:
-            await self._mrack_transformer.init(global_context.PROV_CONFIG, {})
-        except NotAuthenticatedError as kinit_err:
-            raise ProvisionError(kinit_err) from kinit_err
-        except AttributeError as hub_err:
-            raise ProvisionError(
-                f"Can not use current kerberos ticket to authenticate: {hub_err}"
-                ) from hub_err
-        except FileNotFoundError as missing_conf_err:
-            raise ProvisionError(
-                f"Configuration file missing: {missing_conf_err.filename}"
-                ) from missing_conf_err
+    Configuration files are parsed only when the configuration file
+    changes, guests sharing the same configuration reuse the context.
+    """
+    # use global context class
+    global_context = mrack.context.global_context
+
+    try:
+        global_context.init(mrack_config)
+    except mrack.errors.ConfigError as mrack_conf_err:
+        raise ProvisionError(mrack_conf_err)
+
+    return global_context
+
+
+# Initialized transformers shared by all guests, one per configuration file
+_TRANSFORMERS: Dict[str, 'asyncio.Future[Any]'] = {}
+
+
+async def _init_transformer(mrack_config: str) -> TmtBeakerTransformer:
+    """ Create a transformer and authenticate its provider to Beaker hub """
+    global_context = _init_global_context(mrack_config)
+
+    transformer = TmtBeakerTransformer()
+    try:
+        await transformer.init(global_context.PROV_CONFIG, {})
+    except NotAuthenticatedError as kinit_err:
+        raise ProvisionError(kinit_err) from kinit_err
+    except AttributeError as hub_err:
+        raise ProvisionError(
+            f"Can not use current kerberos ticket to authenticate: {hub_err}"
+            ) from hub_err
+    except FileNotFoundError as missing_conf_err:
+        raise ProvisionError(
+            f"Configuration file missing: {missing_conf_err.filename}"
+            ) from missing_conf_err
+
+    transformer._provider.poll_sleep = DEFAULT_PROVISION_TICK
+
+    return transformer
 
+
+async def _get_transformer(mrack_config: str) -> TmtBeakerTransformer:
+    """
+    Return the transformer shared by all guests
+
+    The transformer, together with its provider and the Beaker hub
+    session, is created on the first use, guests requested later reuse
+    it. Must be called from the shared event loop.
+    """
+    if mrack_config not in _TRANSFORMERS:
+        _TRANSFORMERS[mrack_config] = asyncio.ensure_future(_init_transformer(mrack_config))
+
+    try:
+        return await _TRANSFORMERS[mrack_config]
+
+    except Exception:
+        # Do not remember any failure, let the next guest try again
+        _TRANSFORMERS.pop(mrack_config, None)
+        raise
+
+
+class BeakerAPI:
+    # req is a requirement passed to Beaker mrack provisioner
+    mrack_requirement: Dict[str, Any] = {}
+    dsp_name: str = "Beaker"
+
+    def __init__(self, guest: 'GuestBeaker') -> None:
+        """ Initialize the API class with defaults """
+        self._guest = guest
+
+    async def init(self) -> None:
+        """ Load the config and connect to Beaker """
+        # FIXME: cast() - https://github.com/teemtee/tmt/issues/1372
+        parent = cast(tmt.steps.provision.Provision, self._guest.parent)
+
+        assert parent.plan.my_run is not None  # narrow type
+        assert parent.plan.my_run.workdir is not None  # narrow type
+        import_and_load_mrack_deps(parent.plan.my_run.workdir)
+
+        self._mrack_transformer = await _get_transformer(_find_mrack_config())
         self._mrack_provider = self._mrack_transformer._provider
-        self._mrack_provider.poll_sleep = DEFAULT_PROVISION_TICK
 
-    @async_run
     async def create(
             self,
             data: Dict[str, Any],
-            ) -> Any:
+            ) -> GuestInspectType:
         """
         Create - or request creation of - a resource using mrack up.
 
@@ -329,25 +444,36 @@ class BeakerAPI:
 
         """
         mrack_requirement = self._mrack_transformer.create_host_requirement(data)
-        log_msg_start = f"{self.dsp_name} [{self.mrack_requirement.get('name')}]"
-        self._bkr_job_id, self._req = await self._mrack_provider.create_server(mrack_requirement)
-        return self._mrack_provider._get_recipe_info(self._bkr_job_id, log_msg_start)
+        self._guest.bkr_job_id, self._req = await self._mrack_provider.create_server(
+            mrack_requirement)
+        return cast(
+            GuestInspectType,
+            self._mrack_provider._get_recipe_info(self._bkr_job_id, self._log_msg_start))
 
-    @async_run
     async def inspect(
             self,
-            ) -> Any:
+            ) -> GuestInspectType:
         """ Inspect a resource (kinda wait till provisioned) """
-        log_msg_start = f"{self.dsp_name} [{self.mrack_requirement.get('name')}]"
-        return self._mrack_provider._get_recipe_info(self._bkr_job_id, log_msg_start)
+        return cast(
+            GuestInspectType,
+            self._mrack_provider._get_recipe_info(self._bkr_job_id, self._log_msg_start))
 
-    @async_run
     async def delete(  # destroy
             self,
             ) -> Any:
         """ Delete - or request removal of - a resource """
         return await self._mrack_provider.delete_host(self._bkr_job_id, None)
 
+    @property
+    def _bkr_job_id(self) -> str:
+        """ Beaker job id, kept in guest data to survive tmt restarts """
+        assert self._guest.bkr_job_id is not None  # narrow type
+        return self._guest.bkr_job_id
+
+    @property
+    def _log_msg_start(self) -> str:
+        return f"{self.dsp_name} [{self.mrack_requirement.get('name')}]"
+
 
 class GuestBeaker(tmt.GuestSsh):
     """ Beaker guest instance """
@@ -360,48 +486,96 @@ class GuestBeaker(tmt.GuestSsh):
 
     # Provided in Beaker response
     job_id: Optional[str]
+    bkr_job_id: Optional[str]
 
     # Timeouts and deadlines
     provision_timeout: int
     provision_tick: int
     _api: Optional[BeakerAPI] = None
 
+    async def _get_api(self) -> BeakerAPI:
+        """ Create BeakerAPI leveraging mrack, from within the shared event loop """
+        if self._api is None:
+            api = BeakerAPI(self)
+            await api.init()
+            self._api = api
+
+        return self._api
+
     @property
     def api(self) -> BeakerAPI:
         """ Create BeakerAPI leveraging mrack """
         if self._api is None:
-            self._api = BeakerAPI(self)
+            return run_async(self._get_api())
 
         return self._api
 
     @property
     def is_ready(self) -> bool:
         """ Check if provisioning of machine is done """
-        if self.job_id is None:
+        if self.bkr_job_id is None:
             return False
 
         assert mrack is not None
 
         try:
-            response = self.api.inspect()
+            return run_async(self.api.inspect())["status"] == 'Reserved'
+
+        except mrack.errors.MrackError:
+            return False
+
+    async def _wait_for_reservation(
+            self,
+            api: BeakerAPI,
+            current: GuestInspectType,
+            progress_message: updatable_message) -> GuestInspectType:
+        """
+        Wait until the Beaker job reserves the guest
 
-            if response["status"] == "Aborted":
-                return False
+        Start from the ``current`` job state, as returned on submission,
+        then poll soon after the state changes, back off while it stays
+        the same, up to the provisioning tick.
+        """
+        deadline = time.monotonic() + self.provision_timeout
+        min_tick = min(DEFAULT_PROVISION_TICK_MIN, self.provision_tick)
+        interval = min_tick
+        previous_state: Optional[str] = None
 
-            current = cast(GuestInspectType, response)
+        while True:
             state = current["status"]
-            if state in {"Error, Aborted", "Cancelled"}:
-                return False
+
+            state_color = GUEST_STATE_COLORS.get(
+                state, GUEST_STATE_COLOR_DEFAULT
+                )
+
+            progress_message.update(state, color=state_color)
+
+            if state in {"Error", "Aborted", "Cancelled"}:
+                raise ProvisionError(
+                    f"Failed to create, provisioning failed with state '{state}'."
+                    )
 
             if state == 'Reserved':
-                return True
+                return current
+
+            if state == previous_state:
+                interval = min(interval * 2, self.provision_tick)
             else:
-                return False
+                interval = min_tick
+                previous_state = state
 
-        except mrack.errors.MrackError:
-            return False
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                await api.delete()
+                raise ProvisionError(
+                    f'Failed to provision in the given amount '
+                    f'of time (--provision-timeout={self.provision_timeout}).'
+                    )
 
-    def _create(self, tmt_name: str) -> None:
+            await asyncio.sleep(min(interval, remaining))
+            current = await api.inspect()
+
+    async def _create(self, tmt_name: str) -> None:
         """ Create beaker job xml request and submit it to Beaker hub """
 
         data: Dict[str, Any] = {
@@ -415,8 +589,10 @@ class GuestBeaker(tmt.GuestSsh):
         if self.arch is not None:
             data["arch"] = self.arch
 
+        api = await self._get_api()
+
         try:
-            response = self.api.create(data)
+            response = await api.create(data)
         except ProvisioningError as mrack_provisioning_err:
             raise ProvisionError(
                 f"Failed to create, response:\n{mrack_provisioning_err}")
@@ -428,52 +604,12 @@ class GuestBeaker(tmt.GuestSsh):
             raise ProvisionError(
                 f"Failed to create, response: '{response}'.")
 
-        self.job_id = response["id"] if not response["system"] else response["system"]
+        self.job_id = response["system"] or response["id"]
         self.info('job id', self.job_id, 'green')
 
         with updatable_message(
                 "status", indent_level=self._level()) as progress_message:
-
-            def get_new_state() -> GuestInspectType:
-                response = self.api.inspect()
-
-                if response["status"] == "Aborted":
-                    raise ProvisionError(
-                        f"Failed to create, "
-                        f"unhandled API response '{response['status']}'."
-                        )
-
-                current = cast(GuestInspectType, response)
-                state = current["status"]
-                state_color = GUEST_STATE_COLORS.get(
-                    state, GUEST_STATE_COLOR_DEFAULT
-                    )
-
-                progress_message.update(state, color=state_color)
-
-                if state in {"Error, Aborted", "Cancelled"}:
-                    raise ProvisionError(
-                        'Failed to create, provisioning failed.'
-                        )
-
-                if state == 'Reserved':
-                    return current
-
-                raise tmt.utils.WaitingIncomplete()
-
-            try:
-                guest_info = tmt.utils.wait(
-                    self, get_new_state, datetime.timedelta(
-                        seconds=self.provision_timeout),
-                    tick=self.provision_tick
-                    )
-
-            except tmt.utils.WaitingTimedOutError:
-                response = self.api.delete()
-                raise ProvisionError(
-                    f'Failed to provision in the given amount '
-                    f'of time (--provision-timeout={self.provision_timeout}).'
-                    )
+            guest_info = await self._wait_for_reservation(api, response, progress_message)
 
         self.guest = guest_info['system']
         self.info('address', self.guest, 'green')
@@ -488,7 +624,7 @@ class GuestBeaker(tmt.GuestSsh):
         """
 
         if self.job_id is None or self.guest is None:
-            self._create(self._tmt_name())
+            run_async(self._create(self._tmt_name()))
 
     def stop(self) -> None:
         """ Stop the guest """
@@ -498,10 +634,12 @@ class GuestBeaker(tmt.GuestSsh):
     def remove(self) -> None:
         """ Remove the guest """
 
-        if self.job_id is None:
+        if self.bkr_job_id is None:
+            if self.job_id is not None:
+                self.warn(f"Beaker job of guest '{self.job_id}' is unknown, not cancelling it.")
             return
 
-        self.api.delete()
+        run_async(self.api.delete())
 
 
 @tmt.steps.provides_method('beaker')
@@ -543,8 +681,9 @@ class ProvisionBeaker(tmt.steps.provision.ProvisionPlugin):
                 ),
             click.option(
                 '--provision-tick', metavar='SECONDS',
-                help=f'How often check Beaker for provisioning status, '
-                     f'{DEFAULT_PROVISION_TICK} seconds by default.',
+                help=f'The longest time between checks of Beaker provisioning status, '
+                     f'{DEFAULT_PROVISION_TICK} seconds by default. Status is checked '
+                     f'more often right after it changes.',
                 ),
             ] + super().options(how)
 
@@ -564,8 +703,6 @@ class ProvisionBeaker(tmt.steps.provision.ProvisionPlugin):
 
     def go(self) -> None:
         """ Provision the guest """
-        import_and_load_mrack_deps(self.workdir, self.name)
-
         super().go()
 
         data = BeakerGuestData(
@@ -3509,6 +3509,7 @@ class updatable_message(contextlib.AbstractContextManager):  # type: ignore[type
             self.enabled = False
 
         self._previous_line: Optional[str] = None
+        self._previous_color: Optional[str] = None
 
     def __enter__(self) -> 'updatable_message':
         return self
@@ -3521,6 +3522,10 @@ class updatable_message(contextlib.AbstractContextManager):  # type: ignore[type
         if not self.enabled:
             return
 
+        # Nothing to redraw if the message did not change
+        if value == self._previous_line and color == self._previous_color:
+            return
+
         if self._previous_line is not None:
             message = value.ljust(len(self._previous_line))
 
@@ -3528,6 +3533,7 @@ class updatable_message(contextlib.AbstractContextManager):  # type: ignore[type
             message = value
 
         self._previous_line = value
+        self._previous_color = color
 
         message = tmt.log.indent(
             self.key,